@@ -0,0 +1,17 @@
+# Cython declarations for messages.py (pure-Python mode).
+# Only used when building with ELMKIT_ENABLE_SPEEDUPS=1, see setup.py.
+import cython
+
+cpdef bint _is_message_like_obj(object obj)
+
+cpdef dict _own_message_to_dict(object m, bint strip_meta)
+
+cpdef dict _message_obj_to_dict(object m, bint strip_meta)
+
+@cython.locals(role=object, content=object)
+cpdef dict _coerce_message_dict(object d, bint strip_meta)
+
+cpdef _validate_message_dict(dict d)
+
+@cython.locals(i=Py_ssize_t)
+cpdef _validate_content(object content)
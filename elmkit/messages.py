@@ -1,7 +1,9 @@
 # message_core.py
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, is_dataclass
-from typing import Any, Literal
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Literal
 
 # ---------------------------------------------------------------------
 # Minimal message primitives
@@ -12,8 +14,25 @@ Role = Literal["system", "user", "assistant", "tool", "developer"]  # not enforc
 Block = list[str, Any]                    # e.g., {"type": "text", "text": "..."}
 Content = str | list[Block]         # string or multimodal-style blocks
 
+# Known roles (and their common casings) map straight to an interned lowercase
+# string; anything else goes through the small lru_cache below. Either way roles
+# end up interned, so later `m.role == "system"` checks short-circuit on identity.
+_ROLES = ("system", "user", "assistant", "tool", "developer")
+_VALID_ROLES = frozenset(_ROLES)
+_ROLE_CACHE: dict[str, str] = {
+    variant: sys.intern(r)
+    for r in _ROLES
+    for variant in (r, r.capitalize(), r.upper())
+}
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=32)
+def _lower_role(role: str) -> str:
+    return sys.intern(role.lower())
+
+
+# slots: no per-instance __dict__; frozen+slots instances still pickle via the
+# __getstate__/__setstate__ pair dataclasses generates, but can't gain new attrs
+@dataclass(frozen=True, slots=True)
 class Message:
     role: str
     content: Content
@@ -24,35 +43,61 @@ class Message:
 
     def to_dict(self, include_meta: bool = False) -> dict[str, Any]:
         """Convert this Message into a dict suitable for API calls or logging."""
+        n, t, m = self.name, self.tool_call_id, self.meta  # one slot read each
         d = {
             "role": self.role,
             "content": self.content,
         }
-        if self.name:
-            d["name"] = self.name
-        if self.tool_call_id:
-            d["tool_call_id"] = self.tool_call_id
-        if include_meta and self.meta:
-            d["meta"] = self.meta
+        if n:
+            d["name"] = n
+        if t:
+            d["tool_call_id"] = t
+        if include_meta and m:
+            d["meta"] = m
         return d
 
 def msg(role: str, content: Content, **kw) -> Message:
     """Primary factory. Lightweight and permissive by design."""
-    return Message(role=role.lower(), content=content, **kw)
+    return Message(role=_ROLE_CACHE.get(role) or _lower_role(role), content=content, **kw)
+
+# sugar: positional Message construction with the lowercase role literal,
+# no msg() frame and no **kw dict
+def system(content: Content, *, name: str | None = None, tool_call_id: str | None = None,
+           meta: dict[str, Any] | None = None) -> Message:
+    return Message("system", content, name, tool_call_id, meta)
+
+def user(content: Content, *, name: str | None = None, tool_call_id: str | None = None,
+         meta: dict[str, Any] | None = None) -> Message:
+    return Message("user", content, name, tool_call_id, meta)
+
+def assistant(content: Content, *, name: str | None = None, tool_call_id: str | None = None,
+              meta: dict[str, Any] | None = None) -> Message:
+    return Message("assistant", content, name, tool_call_id, meta)
 
-# sugar
-def system(content: Content, **kw) -> Message:    return msg("system", content, **kw)
-def user(content: Content, **kw) -> Message:      return msg("user", content, **kw)
-def assistant(content: Content, **kw) -> Message: return msg("assistant", content, **kw)
-def tool(content: Content, **kw) -> Message:      return msg("tool", content, **kw)
-def developer(content: Content, **kw) -> Message: return msg("developer", content, **kw)
+def tool(content: Content, *, name: str | None = None, tool_call_id: str | None = None,
+         meta: dict[str, Any] | None = None) -> Message:
+    return Message("tool", content, name, tool_call_id, meta)
+
+def developer(content: Content, *, name: str | None = None, tool_call_id: str | None = None,
+              meta: dict[str, Any] | None = None) -> Message:
+    return Message("developer", content, name, tool_call_id, meta)
 
 
 # ---------------------------------------------------------------------
 # OpenAI adapter
 # ---------------------------------------------------------------------
+
+# OpenAI has no 'developer' role in chat messages; send it as 'system'
+_OPENAI_ROLE_REMAP: dict[str, str] = {
+    "developer": "system",
+    "system": "system",
+    "user": "user",
+    "assistant": "assistant",
+    "tool": "tool",
+}
+
 def to_openai(
-    messages: list[Message],
+    messages: Iterable[Message],
     *,
     use_instructions: bool = False,
 ) -> dict[str, Any]:
@@ -64,29 +109,51 @@ def to_openai(
     - 'developer' role is mapped to 'system' for OpenAI compatibility.
     - Content passes through unchanged (str or list[blocks]).
     """
-    instructions_content: Content | None = None
-    rendered: list[dict[str, Any]] = []
+    lifted: list[Content] = []
+    payload: dict[str, Any] = {
+        "messages": list(_render_openai(messages, lifted if use_instructions else None))
+    }
+    if lifted and lifted[0] is not None:
+        payload["instructions"] = lifted[0]
+    return payload
 
-    # If requested, lift the first system message into instructions
-    if use_instructions:
-        for i, m in enumerate(messages):
-            if m.role == "system":
-                instructions_content = m.content
-                messages = messages[:i] + messages[i+1:]
-                break
+def to_openai_iter(
+    messages: Iterable[Message],
+    *,
+    use_instructions: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """
+    Lazily yield the chat messages to_openai() would render, one dict at a time,
+    for consumers that stream them (e.g. straight into a JSON encoder).
+    With use_instructions=True the FIRST system message is skipped, as it
+    belongs in 'instructions' rather than in the message list.
+    """
+    return _render_openai(messages, [] if use_instructions else None)
 
+def _render_openai(
+    messages: Iterable[Message],
+    lifted: list[Content] | None,
+) -> Iterator[dict[str, Any]]:
+    # Single pass: when `lifted` is given, the first system message's content is
+    # appended to it instead of being rendered, so iterators work as input too
+    lift = lifted is not None
+    remap_get = _OPENAI_ROLE_REMAP.get
     for m in messages:
-        rendered.append({
-            "role": "system" if m.role == "developer" else m.role,
+        if lift and m.role == "system":
+            lifted.append(m.content)
+            lift = False
+            continue
+        d = {
+            "role": remap_get(m.role) or m.role,
             "content": m.content,
-            **({"name": m.name} if m.name else {}),
-            **({"tool_call_id": m.tool_call_id} if m.tool_call_id else {}),
-        })
-
-    payload: dict[str, Any] = {"messages": rendered}
-    if use_instructions and instructions_content is not None:
-        payload["instructions"] = instructions_content
-    return payload
+        }
+        n = m.name
+        if n:
+            d["name"] = n
+        t = m.tool_call_id
+        if t:
+            d["tool_call_id"] = t
+        yield d
 
 # ---------------------------------------------------------------------
 # Normalize input format
@@ -98,9 +165,11 @@ def normalize(
     data: MessagesIn,
     *,
     strip_meta: bool = True,
+    strict: bool = False,
 ) -> dict[str, Any]:
     """
     Normalize any accepted message input into {"messages": [...]} ready for LLM API.
+    With strict=True, roles outside system/user/assistant/tool/developer are rejected.
     Accepted:
       1) str
       2) single dict {role, content}
@@ -109,56 +178,106 @@ def normalize(
       5) list of Message-like dataclasses
       6) full payload dict {"messages": [...], "instructions": ...}
     """
+    messages = _normalize_to_list(data, strip_meta)
+    if strict:
+        for d in messages:
+            if d["role"] not in _VALID_ROLES:
+                raise ValueError(f"Unknown role {d['role']!r}")
+    payload: dict[str, Any] = {"messages": messages}
+    # Case 6 also carries the provider 'instructions' through
+    if isinstance(data, dict) and "messages" in data and "instructions" in data:
+        payload["instructions"] = data["instructions"]
+    return payload
+
+# --------------------- internals ---------------------
+
+def _normalize_to_list(data: MessagesIn, strip_meta: bool) -> list[dict[str, Any]]:
+    # normalize() minus the {"messages": ...} wrapper, for callers that only need the list
+
+    # Exact-type fast paths first; isinstance fallbacks below keep subclasses working
+    t = type(data)
+    if t is str:
+        return [{"role": "user", "content": data}]
+    elif t is dict:
+        if "messages" not in data:
+            return [_coerce_message_dict(data, strip_meta=strip_meta)]
+    elif t is list:
+        return _normalize_list(data, strip_meta=strip_meta)
+    elif t is Message:
+        return [_own_message_to_dict(data, strip_meta)]
+
     # Case 6: full provider payload
     if isinstance(data, dict) and "messages" in data:
         if not isinstance(data["messages"], list):
             raise TypeError("'messages' must be a list")
-        payload: dict[str, Any] = {
-            "messages": [_coerce_message_dict(it, strip_meta=strip_meta) for it in data["messages"]]
-        }
-        if "instructions" in data:
-            payload["instructions"] = data["instructions"]
-        return payload
+        return [_coerce_message_dict(it, strip_meta=strip_meta) for it in data["messages"]]
 
     # Case 1: bare string
     if isinstance(data, str):
-        return {"messages": [{"role": "user", "content": data}]}
+        return [{"role": "user", "content": data}]
 
     # Case 4: single Message-like dataclass
     if _is_message_like_obj(data):
-        return {"messages": [_message_obj_to_dict(data, strip_meta=strip_meta)]}
+        return [_message_obj_to_dict(data, strip_meta=strip_meta)]
 
     # Case 2: single message dict
     if isinstance(data, dict):
-        return {"messages": [_coerce_message_dict(data, strip_meta=strip_meta)]}
+        return [_coerce_message_dict(data, strip_meta=strip_meta)]
 
     # Case 3 & 5: list of dicts and/or Message-like dataclasses
     if isinstance(data, list):
-        if not data:
-            raise ValueError("Empty message list is not allowed")
-        items: list[dict[str, Any]] = []
-        for it in data:
-            if _is_message_like_obj(it):
-                items.append(_message_obj_to_dict(it, strip_meta=strip_meta))
-            elif isinstance(it, dict):
-                items.append(_coerce_message_dict(it, strip_meta=strip_meta))
-            else:
-                raise TypeError("List items must be dicts or dataclass with 'role' and 'content'")
-        return {"messages": items}
+        return _normalize_list(data, strip_meta=strip_meta)
 
     raise TypeError("Invalid input: must be str, dict, list, or Message-like dataclass")
 
-# --------------------- internals ---------------------
+
+def _normalize_list(data: list[Any], *, strip_meta: bool) -> list[dict[str, Any]]:
+    if not data:
+        raise ValueError("Empty message list is not allowed")
+    # plain dicts are the common case: dispatch them inline, everything else per item
+    return [
+        _coerce_message_dict(it, strip_meta) if type(it) is dict else _coerce_list_item(it, strip_meta)
+        for it in data
+    ]
+
+def _coerce_list_item(it: Any, strip_meta: bool) -> dict[str, Any]:
+    if type(it) is Message:
+        return _own_message_to_dict(it, strip_meta)
+    if _is_message_like_obj(it):
+        return _message_obj_to_dict(it, strip_meta=strip_meta)
+    if isinstance(it, dict):
+        return _coerce_message_dict(it, strip_meta=strip_meta)
+    raise TypeError("List items must be dicts or dataclass with 'role' and 'content'")
 
 def _is_message_like_obj(obj) -> bool:
-    return is_dataclass(obj) and hasattr(obj, "role") and hasattr(obj, "content")
+    # role/content may be set per instance (e.g. in __post_init__), so only the
+    # dataclass check is cached by type
+    return _is_dataclass_type(type(obj)) and hasattr(obj, "role") and hasattr(obj, "content")
+
+@lru_cache(maxsize=64)
+def _is_dataclass_type(t: type) -> bool:
+    return is_dataclass(t)
+
+def _own_message_to_dict(m: Message, strip_meta: bool) -> dict[str, Any]:
+    # our own Message: layout is known, so skip the dataclass introspection and
+    # getattr probes, but still validate -- Message itself checks nothing
+    if not m.role or m.content is None:
+        raise ValueError("Message object must have 'role' and 'content'")
+    d = m.to_dict(include_meta=not strip_meta)
+    role = m.role
+    if type(role) is not str:
+        role = str(role)
+    d["role"] = _ROLE_CACHE.get(role) or _lower_role(role)  # Message() itself doesn't lowercase
+    _validate_content(d["content"])
+    return d
 
-def _message_obj_to_dict(m: Any, *, strip_meta: bool) -> dict[str, Any]:
+def _message_obj_to_dict(m: Any, strip_meta: bool) -> dict[str, Any]:
     # Works with your Message dataclass: role, content, name, tool_call_id, meta
     if not getattr(m, "role", None) or getattr(m, "content", None) is None:
         raise ValueError("Message object must have 'role' and 'content'")
+    role = str(m.role)
     d = {
-        "role": str(m.role).lower(),
+        "role": _ROLE_CACHE.get(role) or _lower_role(role),
         "content": m.content,
     }
     if getattr(m, "name", None):
@@ -167,37 +286,41 @@ def _message_obj_to_dict(m: Any, *, strip_meta: bool) -> dict[str, Any]:
         d["tool_call_id"] = m.tool_call_id
     if (not strip_meta) and getattr(m, "meta", None):
         d["meta"] = m.meta
-    _validate_message_dict(d)  # light validation
+    _validate_content(d["content"])  # light validation; role was checked above
     return d
 
-def _coerce_message_dict(d: dict[str, Any], *, strip_meta: bool) -> dict[str, Any]:
-    if not isinstance(d, dict):
+def _coerce_message_dict(d: dict[str, Any], strip_meta: bool) -> dict[str, Any]:
+    if type(d) is not dict and not isinstance(d, dict):
         raise TypeError("Message item must be a dict")
-    role = d.get("role", None)
-    content = d.get("content", None)
-    if not isinstance(role, str) or not role:
+    role = d.get("role")
+    content = d.get("content")
+    if (type(role) is not str and not isinstance(role, str)) or not role:
         raise ValueError("Each message dict must have non-empty string 'role'")
     if content is None:
         raise ValueError("Each message dict must have 'content'")
 
     out = {
-        "role": role.lower(),
+        "role": _ROLE_CACHE.get(role) or _lower_role(role),
         "content": content,
     }
-    # optional fields
-    if "name" in d and d["name"] is not None:
-        if not isinstance(d["name"], str):
+    # optional fields (one probe each; absent and None are treated alike)
+    n = d.get("name")
+    if n is not None:
+        if type(n) is not str and not isinstance(n, str):
             raise TypeError("'name' must be a string when provided")
-        out["name"] = d["name"]
-    if "tool_call_id" in d and d["tool_call_id"] is not None:
-        if not isinstance(d["tool_call_id"], str):
+        out["name"] = n
+    t = d.get("tool_call_id")
+    if t is not None:
+        if type(t) is not str and not isinstance(t, str):
             raise TypeError("'tool_call_id' must be a string when provided")
-        out["tool_call_id"] = d["tool_call_id"]
+        out["tool_call_id"] = t
     # optionally preserve meta
-    if (not strip_meta) and ("meta" in d) and d["meta"] is not None:
-        if not isinstance(d["meta"], dict):
-            raise TypeError("'meta' must be a dict when provided")
-        out["meta"] = d["meta"]
+    if not strip_meta:
+        m = d.get("meta")
+        if m is not None:
+            if type(m) is not dict and not isinstance(m, dict):
+                raise TypeError("'meta' must be a dict when provided")
+            out["meta"] = m
 
     _validate_message_dict(out)
     return out
@@ -207,14 +330,21 @@ def _validate_message_dict(d: dict[str, Any]) -> None:
     if not isinstance(d.get("role"), str) or not d["role"]:
         raise ValueError("Invalid 'role'")
     # content: allow str or list (blocks); reject other types
-    content = d.get("content")
-    if isinstance(content, str):
+    _validate_content(d.get("content"))
+
+def _validate_content(content: Any) -> None:
+    t = type(content)
+    if t is str or (t is not list and isinstance(content, str)):
         if content == "":
             raise ValueError("Empty string content is not allowed")
-    elif isinstance(content, list):
+    elif t is list or isinstance(content, list):
         # We don't enforce vendor block schemas—just ensure it's a list of dict-like parts
         for i, part in enumerate(content):
-            if not isinstance(part, dict):
-                raise TypeError(f"content blocks must be dicts; got {type(part).__name__} at index {i}")
+            if type(part) is not dict and not isinstance(part, dict):
+                _raise_part_type(i, part)
     else:
         raise TypeError("content must be a string or a list of blocks (dicts)")
+
+def _raise_part_type(i: int, part: Any) -> None:
+    # cold path: keeps the error formatting out of _validate_content's loop
+    raise TypeError(f"content blocks must be dicts; got {type(part).__name__} at index {i}")
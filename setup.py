@@ -0,0 +1,24 @@
+# Optional compiled build of elmkit.messages (pure-Python mode, see messages.pxd).
+# Opt in with:  ELMKIT_ENABLE_SPEEDUPS=1 python setup.py build_ext --inplace
+# This is the only supported route: pyproject.toml builds with hatchling, so
+# `pip install .` / `python -m build` never run this file and stay pure Python.
+import os
+import warnings
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("ELMKIT_ENABLE_SPEEDUPS") == "1":
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        warnings.warn("ELMKIT_ENABLE_SPEEDUPS=1 but Cython is not installed; building pure Python")
+    else:
+        ext_modules = cythonize(
+            ["elmkit/messages.py"],
+            language_level=3,
+            # types come from messages.pxd only; annotations stay documentation
+            compiler_directives={"annotation_typing": False},
+        )
+
+setup(ext_modules=ext_modules)